@@ -1,6 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
-import appdirs
 from pathlib import Path
 
 
@@ -13,6 +12,8 @@ def get_pkg_data_path():
 
 
 def get_user_data_dir():
+    # appdirs is only needed here, so defer the import
+    import appdirs
     return Path(appdirs.user_data_dir('tollan', 'toltec'))
 
 
@@ -18,6 +18,9 @@ OPTION_SETTINGS = dict(
         )
 CTX_NO_RECREATE_OBJ = '_ctx_no_recreate_obj'
 
+_re_option_arg_sep = re.compile(r'[,;]+')
+_re_paths_sep = re.compile(r'[:;,]+')
+
 
 class OptionalArgumentGroup(click.Command):
     def parse_args(self, ctx, args):
@@ -65,14 +68,14 @@ def varg_command(cli, name, *others):
 
 
 def split_option_arg(arg):
-    return re.split(r'[,;]+', arg)
+    return _re_option_arg_sep.split(arg)
 
 
 def split_paths(ctx, param, value):
     try:
         vs = []
         for v in value:
-            vs.extend(re.split(r'[:;,]+', v))
+            vs.extend(_re_paths_sep.split(v))
         paths = tuple(param.type.convert(v, param, ctx) for v in vs)
         return paths
     except ValueError:
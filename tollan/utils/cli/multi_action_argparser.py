@@ -1,12 +1,30 @@
 #! /usr/bin/env python
 
 import argparse
+import functools
+import re
 import wrapt
 
 
 __all__ = ['MultiActionArgumentParser', ]
 
 
+_re_non_blank_line_start = re.compile(r'^(?=[^\S\n]*\S)', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_mpi_rank():
+    """Return the MPI rank of this process, or None if no mpi4py.
+
+    mpi4py is only imported on first call, as it initializes MPI.
+    """
+    try:
+        from mpi4py import MPI
+    except ModuleNotFoundError:
+        return None
+    return MPI.COMM_WORLD.Get_rank()
+
+
 class RecursiveHelpAction(argparse._HelpAction):
 
     @staticmethod
@@ -18,8 +36,10 @@ class RecursiveHelpAction(argparse._HelpAction):
         consist solely of whitespace characters.
         """
         if predicate is None:
-            def predicate(line):
-                return line.strip()
+            # prefix all non-blank lines in one pass.
+            # backslashes are the only special chars in the replacement.
+            return _re_non_blank_line_start.sub(
+                prefix.replace('\\', r'\\'), text)
 
         def prefixed_lines():
             for line in text.splitlines(True):
@@ -103,21 +123,12 @@ class MultiActionArgumentParser(wrapt.ObjectProxy):
     @staticmethod
     def parser_action(parser, mpi_passthrough=False):
         def decorator(action):
-            if mpi_passthrough:
+            if mpi_passthrough or _get_mpi_rank() in (None, 0):
                 func = action
             else:
                 # we return an no-op action for worker ranks
-                try:
-                    from mpi4py import MPI
-                    comm = MPI.COMM_WORLD
-                    rank = comm.Get_rank()
-                    if rank == 0:
-                        func = action
-                    else:
-                        def func(*a, **k):
-                            return
-                except ModuleNotFoundError:
-                    func = action
+                def func(*a, **k):
+                    return
             parser.set_defaults(func=func)
             return action
         return decorator
@@ -1,17 +1,39 @@
 #! /usr/bin/env python
 
+import os
+import threading
+from collections import OrderedDict
 from ..namespace import Namespace
+from ..log import get_logger
 from schema import Schema, Optional, Use
 import sqlalchemy as sa
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy import MetaData
+from sqlalchemy.engine.url import make_url
 from wrapt import ObjectProxy
-from contextlib import contextmanager
 
 
 __all__ = ['TableDef', 'TableDefList', 'SqlaDB']
 
 
+SQLA_POOL_SIZE_ENV = 'TOLLAN_SQLA_POOL_SIZE'
+"""The env var to set the default connection pool size."""
+
+SQLA_POOL_DEFAULTS = {
+    'pool_size': 20,
+    'max_overflow': 30,
+    'pool_timeout': 30,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    }
+"""The default connection pool settings for server backed databases."""
+
+SQLA_QUERY_CACHE_SIZE = 1200
+"""The compiled statement cache size, used with SQLAlchemy >= 1.4."""
+
+_sa_version = tuple(int(v) for v in sa.__version__.split('.')[:2])
+
+
 class TableDef(Namespace):
     """A class that holds definitions to a table."""
 
@@ -56,17 +78,196 @@ class TableDefList(ObjectProxy):
             t.init_table(db)
 
 
+def _make_engine_options(uri, engine_options=None):
+    """Return the engine options for `uri` with dialect specific defaults.
+
+    Items in `engine_options` take precedence over the defaults.
+    """
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    driver = url.get_driver_name()
+    result = dict()
+    has_poolclass = 'poolclass' in (engine_options or dict())
+    if backend != 'sqlite' and not has_poolclass:
+        # size the default queue pool for concurrent use, and recycle
+        # stale connections before they error out mid-transaction.
+        result.update(SQLA_POOL_DEFAULTS)
+        pool_size = os.environ.get(SQLA_POOL_SIZE_ENV, None)
+        if pool_size:
+            result['pool_size'] = int(pool_size)
+    elif url.database in (None, '', ':memory:') and not has_poolclass:
+        # keep a single connection so that the in-memory database is
+        # visible to all threads. Note that the connect_args make the
+        # options uncacheable, so each call gets its own database.
+        result.update(
+            poolclass=sa.pool.StaticPool,
+            connect_args={'check_same_thread': False},
+            )
+    if backend == 'postgresql' and driver == 'psycopg2' \
+            and _sa_version >= (1, 4):
+        # send executemany as paged multi-values statements instead of
+        # one statement per row. The values_plus_batch mode is new in
+        # SQLAlchemy 1.4.
+        result.update(
+            executemany_mode='values_plus_batch',
+            executemany_values_page_size=1000,
+            executemany_batch_page_size=500,
+            )
+    elif backend == 'mssql' and driver == 'pyodbc':
+        result.update(fast_executemany=True)
+    if _sa_version >= (1, 4):
+        result['query_cache_size'] = SQLA_QUERY_CACHE_SIZE
+    engine_options = dict(engine_options or dict())
+    if 'connect_args' in result and 'connect_args' in engine_options:
+        # merge so that the defaults are kept unless overridden
+        engine_options['connect_args'] = dict(
+            result['connect_args'], **engine_options['connect_args'])
+    result.update(engine_options)
+    return result
+
+
+def _new_engine(uri, engine_options):
+    logger = get_logger()
+    # only the pool settings are logged, as the other options such as
+    # connect_args may hold credentials.
+    pool_options = {
+        k: v for k, v in engine_options.items() if k in SQLA_POOL_DEFAULTS}
+    logger.debug(f"create engine for {make_url(uri)!r} with {pool_options}")
+    return sa.create_engine(uri, **engine_options)
+
+
+_engine_cache = OrderedDict()
+_engine_cache_size = 16
+_engine_cache_lock = threading.Lock()
+
+
+def _create_engine_cached(uri, engine_options_items):
+    key = (uri, engine_options_items)
+    with _engine_cache_lock:
+        engine = _engine_cache.get(key, None)
+        if engine is not None:
+            _engine_cache.move_to_end(key)
+            return engine
+        engine = _engine_cache[key] = _new_engine(
+            uri, dict(engine_options_items))
+        if len(_engine_cache) > _engine_cache_size:
+            # release the pooled connections of the least recently used
+            # engine. It is still usable by its holders, which get a new
+            # pool on the next connect.
+            _, evicted = _engine_cache.popitem(last=False)
+            evicted.dispose()
+    return engine
+
+
+def _reset_engine_cache_after_fork():
+    # the pooled connections belong to the parent process, so they are
+    # dropped without being closed.
+    global _engine_cache_lock
+    _engine_cache_lock = threading.Lock()
+    _engine_cache.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_engine_cache_after_fork)
+
+
+def _create_engine(uri, engine_options):
+    """Return the engine for `uri`, shared by calls with the same options."""
+    key = tuple(sorted(engine_options.items()))
+    try:
+        hash(key)
+    except TypeError:
+        # options such as connect_args dicts cannot be cached on
+        return _new_engine(uri, engine_options)
+    return _create_engine_cached(uri, key)
+
+
+class _SessionContext(object):
+    """Commit `session` on exit, or roll it back if an error occurred.
+
+    The session is closed afterwards in either case.
+    """
+
+    __slots__ = ('session', )
+
+    def __init__(self, session):
+        self.session = session
+
+    def __enter__(self):
+        return self.session
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        session = self.session
+        try:
+            if exc_type is None:
+                try:
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+            elif issubclass(exc_type, Exception):
+                session.rollback()
+        finally:
+            self._release()
+        return False
+
+    def _release(self):
+        self.session.close()
+
+
+class _ScopedSessionContext(_SessionContext):
+    """Commit the session of `registry` for the current thread on exit,
+    or roll it back if an error occurred.
+
+    The session is removed from `registry` afterwards in either case.
+    """
+
+    __slots__ = ('registry', )
+
+    def __init__(self, registry):
+        super().__init__(None)
+        self.registry = registry
+
+    def __enter__(self):
+        self.session = self.registry()
+        return self.session
+
+    def _release(self):
+        self.registry.remove()
+
+
 class SqlaDB(Namespace):
     """A class that provide access to database related entities
     similar to that of `flask_sqlalchemy.SQLAlchemy`.
 
     """
+
     @classmethod
     def from_uri(cls, uri, engine_options=None):
-        engine = sa.create_engine(uri, **(engine_options or dict()))
+        """Create instance from database URI.
+
+        The engine, and hence its connection pool, is shared among instances
+        created with the same `uri` and `engine_options`, and lives for the
+        duration of the process.
+
+        Parameters
+        ----------
+        uri : str
+            The database URI.
+        engine_options : dict, optional
+            The keyword arguments passed to `sqlalchemy.create_engine`.
+        """
+        engine_options = _make_engine_options(uri, engine_options)
+        engine = _create_engine(uri, engine_options)
         metadata = sa.MetaData(bind=engine)
-        Session = sessionmaker(bind=engine)
-        return cls(engine=engine, metadata=metadata, Session=Session)
+        # committed objects are not reloaded unless refreshed explicitly
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
+        # sessions are bound to the calling thread, and are discarded
+        # along with the thread-local registry when the thread exits
+        session = scoped_session(Session)
+        return cls(
+                engine=engine, metadata=metadata,
+                Session=Session, session=session)
 
     @property
     def tables(self):
@@ -76,24 +277,53 @@ class SqlaDB(Namespace):
     def from_flask_sqla(cls, db, bind=None):
         engine = db.get_engine(bind=bind)
         metadata = MetaData()
-        Session = sessionmaker(bind=engine)
+        Session = sessionmaker(bind=engine, expire_on_commit=False)
         session = db.create_scoped_session(
             options={'bind': engine})
         return cls(
                 engine=engine, metadata=metadata,
                 Session=Session, session=session)
 
-    def reflect_tables(self):
-        self.metadata.reflect(bind=self.engine)
+    def reflect_tables(self, only=None, views=False, resolve_fks=True):
+        """Load table definitions from the database into `metadata`.
+
+        Tables already present in `metadata` are not reflected again.
+
+        Parameters
+        ----------
+        only : list of str, callable, optional
+            If set, only reflect these tables. See
+            `sqlalchemy.schema.MetaData.reflect`.
+        views : bool
+            If True, also reflect views.
+        resolve_fks : bool
+            If False, tables referred to by foreign keys are not reflected
+            unless they are requested explicitly.
+        """
+        self.metadata.reflect(
+            bind=self.engine, only=only, views=views,
+            resolve_fks=resolve_fks)
 
     @property
-    @contextmanager
     def session_context(self):
-        """Provide a transactional scope around a series of operations."""
-        session = self.session
-        try:
-            yield session
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
+        """Provide a transactional scope around a series of operations.
+
+        A new session is created for the scope and closed on exit, so that
+        its identity map does not outlive the operations.
+
+        .. note::
+
+            The session is always created from `Session`. For instances
+            created with `from_flask_sqla`, this is a plain session bound to
+            the engine, not the Flask scoped session.
+        """
+        return _SessionContext(self.Session())
+
+    def scoped_session_context(self):
+        """Provide a transactional scope around the session bound to the
+        current thread.
+
+        The session is committed on exit, or rolled back if an error
+        occurred, and is removed from the registry afterwards.
+        """
+        return _ScopedSessionContext(self.session)
@@ -3,6 +3,7 @@
 """This module defines a set of helpers for defining database with
 some column naming conventions."""
 
+import functools
 from sqlalchemy import (
         Column, Integer, String, ForeignKey, DateTime, Text)
 from sqlalchemy.sql import expression
@@ -18,6 +19,7 @@ _excluded_from_all = set(globals().keys())
 
 class utcnow(expression.FunctionElement):
     type = DateTime()
+    inherit_cache = True
 
 
 @compiles(utcnow, 'postgresql')
@@ -119,6 +121,12 @@ def updated_at(**kwargs):
 CLIENT_INFO_TABLE_NAME = 'client_info'
 
 
+@functools.lru_cache(maxsize=1)
+def _get_localzone_name():
+    """Return the local time zone name, looked up once per process."""
+    return tzlocal.get_localzone_name()
+
+
 def client_info_table():
     t = {
         'name': CLIENT_INFO_TABLE_NAME,
@@ -136,7 +144,7 @@ def client_info_table():
             Column(
                 'tz',
                 TimezoneType(backend='pytz'),
-                default=tzlocal.get_localzone_name(),
+                default=_get_localzone_name(),
                 comment='The client time zone.'
                 ),
             created_at(),
@@ -179,4 +187,6 @@ def table_info_table():
     return t
 
 
-__all__ = list(set(globals().keys()).difference(_excluded_from_all))
+__all__ = [
+    k for k in set(globals().keys()).difference(_excluded_from_all)
+    if not k.startswith('_')]
@@ -2,7 +2,7 @@
 
 import os
 from .registry import Registry
-import pyaml
+from .fmt import YamlDumper
 
 
 __all__ = ['EnvRegistry', 'env_registry']
@@ -77,4 +77,5 @@ env_registry = EnvRegistry.create()
 """A global environment variable registry instance."""
 
 
-pyaml.add_representer(EnvRegistry, lambda s, d: s.represent_dict(d.summary()))
+YamlDumper.add_representer(
+    EnvRegistry, lambda s, d: s.represent_dict(d.summary()))
@@ -1,11 +1,17 @@
 #! /usr/bin/env python
 
 import inspect
-import pyaml
+import yaml
 import textwrap
 import numpy as np
 import math
+from pathlib import PurePath
 from wrapt import ObjectProxy
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
 # from astropy.modeling import Model
 
 
@@ -147,30 +153,61 @@ def pformat_obj(m):
     return '\n'.join(result)
 
 
+class YamlDumper(_SafeDumper):
+    """Yaml dumper used by `pformat_yaml`.
+
+    This uses the libyaml emitter when available.
+    """
+
+    def ignore_aliases(self, data):
+        # shared objects are written out in full instead of as anchors
+        return True
+
+    def represent_str(self, data):
+        if '\n' in data:
+            return self.represent_scalar(
+                'tag:yaml.org,2002:str', data, style='|')
+        return super().represent_str(data)
+
+
 def pformat_yaml(obj):
     if isinstance(obj, ObjectProxy):
         obj = obj.__wrapped__
-    return f"\n{pyaml.dump(obj)}"
+    s = yaml.dump(
+        obj, Dumper=YamlDumper, default_flow_style=False, sort_keys=False,
+        allow_unicode=True)
+    return f"\n{s}"
+
+
+def _pformat_slice(s):
+    start = '' if s.start is None else s.start
+    stop = '' if s.stop is None else s.stop
+    if s.step is None or s.step == 1:
+        return f'[{start}:{stop}]'
+    return f'[{start}:{stop}:{s.step}]'
+
+
+def _pformat_mask(m):
+    if m.dtype == bool:
+        n = np.count_nonzero(m)
+    else:
+        n = np.sum(m)
+    return f'<mask {n}/{m.size}>'
+
+
+_pformat_fancy_index_funcs = {
+    slice: _pformat_slice,
+    np.ndarray: _pformat_mask,
+    }
 
 
 def pformat_fancy_index(i):
-    if isinstance(i, slice):
-        if i.start is None:
-            start = ''
-        else:
-            start = i.start
-        if i.stop is None:
-            stop = ''
-        else:
-            stop = i.stop
-        result = f'[{start}:{stop}{{}}]'
-        if i.step is None or i.step == 1:
-            result = result.format('')
-        else:
-            result = result.format(f':{i.step}')
-        return result
+    func = _pformat_fancy_index_funcs.get(type(i), None)
+    if func is not None:
+        return func(i)
+    # subclasses of ndarray
     if isinstance(i, np.ndarray):
-        return f'<mask {np.sum(i)}/{i.size}>'
+        return _pformat_mask(i)
     return i
 
 
@@ -246,8 +283,15 @@ def model_to_dict(m):
     return d
 
 
-pyaml.add_representer(np.float64, lambda s, d: s.represent_float(d))
-pyaml.add_representer(np.float32, lambda s, d: s.represent_float(d))
-pyaml.add_representer(np.int32, lambda s, d: s.represent_int(d))
-pyaml.add_representer(np.int64, lambda s, d: s.represent_int(d))
-pyaml.add_representer(None, lambda s, d: s.represent_str(str(d)))
+YamlDumper.add_multi_representer(
+    np.floating, lambda s, d: s.represent_float(float(d)))
+YamlDumper.add_multi_representer(
+    np.integer, lambda s, d: s.represent_int(int(d)))
+YamlDumper.add_multi_representer(
+    dict, lambda s, d: s.represent_dict(d))
+YamlDumper.add_representer(str, YamlDumper.represent_str)
+YamlDumper.add_representer(tuple, lambda s, d: s.represent_list(d))
+YamlDumper.add_representer(set, lambda s, d: s.represent_list(d))
+YamlDumper.add_multi_representer(
+    PurePath, lambda s, d: s.represent_str(str(d)))
+YamlDumper.add_representer(None, lambda s, d: s.represent_str(str(d)))
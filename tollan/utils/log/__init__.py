@@ -3,13 +3,12 @@
 from contextlib import ContextDecorator, AbstractContextManager
 import logging
 import logging.config
-import inspect
+import sys
 import time
 import copy
 from pathlib import Path
 from wrapt import ObjectProxy
 from contextlib import contextmanager
-from astropy.utils.console import human_time
 from ..misc import rupdate
 from . import console_color
 
@@ -245,7 +244,9 @@ def get_logger(name=None):
     of the calling context.
     """
     if name is None:
-        name = inspect.stack()[1][3]
+        # the name of the calling function. This avoids inspect.stack(),
+        # which builds the info, including source context, of all frames.
+        name = sys._getframe(1).f_code.co_name
         # code = inspect.currentframe().f_back.f_code
         # func = [obj for obj in gc.get_referrers(code)][0]
         # name = func.__qualname__
@@ -256,6 +257,8 @@ def _format_time(time):
     if time < 15:
         return f"{time * 1e3:.0f}ms"
     else:
+        # astropy is slow to import, and is only needed for long timings
+        from astropy.utils.console import human_time
         return f"{human_time(time).strip()}"
 
 
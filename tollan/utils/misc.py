@@ -1,4 +1,5 @@
 import functools
+import operator
 import collections.abc
 from types import ModuleType
 import sys
@@ -6,10 +7,8 @@ import importlib
 from contextlib import ContextDecorator
 import itertools
 from pathlib import Path, PurePath, WindowsPath
-import urllib
+from urllib.parse import urlsplit, unquote
 import inspect
-from collections import OrderedDict
-from urllib.parse import urlsplit, urlunsplit
 from typing import NamedTuple
 import re
 import subprocess
@@ -22,7 +21,18 @@ _excluded_from_all = set(globals().keys())
 
 def ensure_abspath(p):
     """Return the fully expanded path for `p`."""
-    return Path(p).expanduser().resolve()
+    if not isinstance(p, Path):
+        p = Path(p)
+    return p.expanduser().resolve()
+
+
+@functools.lru_cache(maxsize=None)
+def _import_module(name):
+    # failed imports raise and are not cached
+    module = sys.modules.get(name, None)
+    if module is not None:
+        return module
+    return importlib.import_module(name)
 
 
 def getobj(name, *args):
@@ -34,12 +44,9 @@ def getobj(name, *args):
     """
     if not isinstance(name, str):
         raise ValueError("name must be a string.")
-    sep = ':'
-    if sep not in name:
-        name = f"{name}:"
-    module, attr = name.split(sep, 1)
+    module, _, attr = name.partition(':')
     try:
-        module = importlib.import_module(module)
+        module = _import_module(module)
     except Exception:
         if not args:
             raise
@@ -49,20 +56,40 @@ def getobj(name, *args):
     return rgetattr(module, attr)
 
 
+_module_from_path_cache = dict()
+
+
 def module_from_path(filepath, name=None):
-    """Load module from filepath."""
-    filepath = Path(filepath)
+    """Load module from filepath.
+
+    The loaded module is cached, and is returned as is for further calls
+    with the same `name` until the file gets modified. The cache can be
+    reset with ``module_from_path.cache_clear()``.
+    """
     if name is None:
+        if not isinstance(filepath, PurePath):
+            filepath = Path(filepath)
         name = f'_module_from_path_{filepath.stem}'
-    spec = importlib.util.spec_from_file_location(
-            name, filepath.as_posix())
+    if isinstance(filepath, PurePath):
+        filepath = filepath.as_posix()
+    filepath = os.fspath(filepath)
+    cache_key = (
+        os.path.abspath(filepath), os.stat(filepath).st_mtime_ns, name)
+    module = _module_from_path_cache.get(cache_key, None)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(name, filepath)
     # print(filepath)
     # print(spec)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
+    _module_from_path_cache[cache_key] = module
     return module
 
 
+module_from_path.cache_clear = _module_from_path_cache.clear
+
+
 def rreload(m: ModuleType):
     """Reload module recursively.
 
@@ -74,15 +101,16 @@ def rreload(m: ModuleType):
     name = m.__name__  # get the name that is used in sys.modules
     name_ext = name + '.'  # support finding sub modules or packages
 
-    def compare(loaded: str):
-        return (loaded == name) or loaded.startswith(name_ext)
-
     # prevent changing iterable while iterating over it
     all_mods = tuple(sys.modules)
-    sub_mods = filter(compare, all_mods)
-    for pkg in sorted(
-            sub_mods, key=lambda item: item.count('.'), reverse=True):
+    # reload the deepest modules first
+    sub_mods = [
+        (pkg.count('.'), pkg) for pkg in all_mods
+        if pkg == name or pkg.startswith(name_ext)]
+    sub_mods.sort(key=operator.itemgetter(0), reverse=True)
+    for _, pkg in sub_mods:
         importlib.reload(sys.modules[pkg])
+    _import_module.cache_clear()
 
 
 def rgetattr(obj, attr, *args):
@@ -91,9 +119,11 @@ def rgetattr(obj, attr, *args):
     Nested attribute is specified as `a.b`.
 
     """
-    def _getattr(obj, attr):
+    if '.' not in attr:
         return getattr(obj, attr, *args)
-    return functools.reduce(_getattr, [obj] + attr.split('.'))
+    for a in attr.split('.'):
+        obj = getattr(obj, a, *args)
+    return obj
 
 
 def rupdate(d, u, copy_subdict=True):
@@ -134,10 +164,9 @@ def rupdate(d, u, copy_subdict=True):
     .. [1] https://stackoverflow.com/a/52099238/1824372
 
     """
-    re_list_append_key = re.compile(r'<<\d?')
     stack = [(d, u)]
     while stack:
-        d, u = stack.pop(0)
+        d, u = stack.pop()
         for k, v in u.items():
             # print(f"processing {d=} {u=} {k=} {v=}")
             if not isinstance(v, collections.abc.Mapping):
@@ -153,10 +182,12 @@ def rupdate(d, u, copy_subdict=True):
             else:
                 default = None  # subdicts in u will be assigned to it.
             if isinstance(d, collections.abc.Sequence):
-                k = int(k)
-                if re.match(re_list_append_key, str(k)) is not None:
-                    d.append(default)
-                    k = -1
+                if not isinstance(k, int):
+                    if str(k).startswith('<<'):
+                        d.append(default)
+                        k = -1
+                    else:
+                        k = int(k)
                 dv = d[k]
             else:
                 dv = d.setdefault(k, default)
@@ -183,28 +214,41 @@ def odict_from_list(lst, key):
 
     Returns
     -------
-    OrderedDict
-        The ordered dict constructed from the list.
+    dict
+        The dict constructed from the list, in the order of the list.
     """
-    return OrderedDict([
-        (key(v) if callable(key) else v[key], v)
-        for v in lst])
+    if callable(key):
+        return {key(v): v for v in lst}
+    return {v[key]: v for v in lst}
 
 
 def dict_product(**kwargs):
     """
     Return the Cartesian product of dicts.
     """
-    return (dict(zip(kwargs.keys(), x))
+    keys = tuple(kwargs.keys())
+    return (dict(zip(keys, x))
             for x in itertools.product(*kwargs.values()))
 
 
 def compose(*fs):
-    """Return composition of functions."""
+    """Return composition of functions.
 
-    def compose2(f, g):
-        return lambda *a, **kw: f(g(*a, **kw))
-    return functools.reduce(compose2, fs)
+    The functions are applied from right to left.
+    """
+    if not fs:
+        raise TypeError("compose requires at least one function.")
+    if len(fs) == 1:
+        return fs[0]
+    *fs_outer, f_inner = fs
+    fs_outer = tuple(reversed(fs_outer))
+
+    def composed(*args, **kwargs):
+        result = f_inner(*args, **kwargs)
+        for f in fs_outer:
+            result = f(result)
+        return result
+    return composed
 
 
 class hookit(ContextDecorator):
@@ -355,6 +399,56 @@ class FileLoc(NamedTuple):
     def exists(self):
         return self.is_local and self.path.exists()
 
+    @classmethod
+    def exists_many(cls, locs):
+        """Return a list of bool indicating whether each of `locs` exists.
+
+        This lists each parent directory once, instead of checking the
+        files one by one. Names are matched with their exact case, so on
+        case-insensitive file systems a path that only differs in case
+        from the entry on disk is reported as not existing.
+
+        Paths that cannot be checked from a listing, such as those ending
+        with ``..`` or those in a parent directory that cannot be listed,
+        are checked individually with `exists`.
+        """
+        entries_by_parent = dict()
+        result = list()
+        for loc in locs:
+            if not loc.is_local:
+                result.append(False)
+                continue
+            path = loc.path
+            name = path.name
+            if name in ('', '..'):
+                # the root, or a name a listing does not include
+                result.append(path.exists())
+                continue
+            parent = path.parent
+            if parent in entries_by_parent:
+                entries = entries_by_parent[parent]
+            else:
+                try:
+                    with os.scandir(parent) as it:
+                        entries = {e.name: e for e in it}
+                except OSError:
+                    # e.g., the parent is not readable but may be
+                    # searchable
+                    entries = None
+                entries_by_parent[parent] = entries
+            if entries is None:
+                result.append(path.exists())
+                continue
+            entry = entries.get(name, None)
+            if entry is None:
+                result.append(False)
+            elif entry.is_symlink():
+                # exists() is false for broken links
+                result.append(path.exists())
+            else:
+                result.append(True)
+        return result
+
     @property
     def is_local(self):
         return self.netloc == ''
@@ -411,9 +505,87 @@ def fileloc(loc, local_parent_path=None, remote_parent_path=None):
     """
     if isinstance(loc, FileLoc):
         return loc
+    return _fileloc_maybe_cached(loc, local_parent_path, remote_parent_path)
+
+
+def filelocs(locs, local_parent_path=None, remote_parent_path=None):
+    """Return a list of `~tollan.utils.FileLoc` objects for `locs`.
+
+    This is the same as calling `fileloc` for each item in `locs`, but
+    the parent paths and the current path are looked up only once.
+    """
+    if local_parent_path is not None:
+        local_parent_path = Path(local_parent_path)
+    if remote_parent_path is not None:
+        remote_parent_path = Path(remote_parent_path)
+    get_cwd = functools.lru_cache(maxsize=None)(os.getcwd)
+    return [
+        loc if isinstance(loc, FileLoc) else _fileloc_maybe_cached(
+            loc, local_parent_path, remote_parent_path, get_cwd=get_cwd)
+        for loc in locs]
+
+
+def _fileloc_is_cacheable(loc):
+    """Return whether `loc` can be resolved without touching the file system.
+
+    Relative local paths are made absolute with `ensure_abspath`, which
+    follows symlinks and the current path, so they are never cached.
+    """
+    if isinstance(loc, PurePath):
+        h, p = None, loc
+    elif isinstance(loc, tuple):
+        h, p = loc
+    elif not isinstance(loc, str):
+        return False
+    elif loc.startswith('file://'):
+        h, p = urlsplit(loc)[1:3]
+    elif loc[1:2] == ':' and _re_windows_path.match(loc):
+        h, p = None, loc
+    elif ':' in loc:
+        h, p = loc.split(':', 1)
+    else:
+        h, p = None, loc
+    if not (h is None or h == ''):
+        # remote paths are never resolved locally
+        return True
+    return os.path.isabs(os.fspath(p))
+
+
+def _fileloc_maybe_cached(
+        loc, local_parent_path, remote_parent_path, get_cwd=None):
+    try:
+        hash((loc, local_parent_path, remote_parent_path))
+        cacheable = _fileloc_is_cacheable(loc)
+    except (TypeError, ValueError):
+        # unhashable or malformed input, left to _fileloc to handle
+        cacheable = False
+    if cacheable:
+        return _fileloc_cached(loc, local_parent_path, remote_parent_path)
+    cwd = None
+    if get_cwd is not None and local_parent_path is None:
+        try:
+            cwd = get_cwd()
+        except OSError:
+            pass
+    return _fileloc(loc, local_parent_path, remote_parent_path, cwd)
+
+
+_re_windows_path = re.compile(r'[A-Z]:\\\w')
+_uri_special_chars = frozenset('%?#;\t\r\n')
+
+
+def _fileloc(loc, local_parent_path, remote_parent_path, cwd=None):
+    # convert the parent paths once for all the branches below
+    if not (local_parent_path is None or isinstance(local_parent_path, Path)):
+        local_parent_path = Path(local_parent_path)
+    if not (
+            remote_parent_path is None
+            or isinstance(remote_parent_path, Path)):
+        remote_parent_path = Path(remote_parent_path)
 
     def _get_abs_path(h, p):
-        p = Path(p)
+        if not isinstance(p, Path):
+            p = Path(p)
         if isinstance(p, WindowsPath):
             if h is None or h == '':
                 # local window path
@@ -427,26 +599,35 @@ def fileloc(loc, local_parent_path=None, remote_parent_path=None):
         # local file
         if h is None or h == '':
             if local_parent_path is not None:
-                return ensure_abspath(Path(
-                        local_parent_path).joinpath(p))
+                return ensure_abspath(local_parent_path.joinpath(p))
+            if cwd is not None and not str(p).startswith('~'):
+                # join with the known cwd so that resolve() does not
+                # need to look it up again.
+                return ensure_abspath(Path(cwd).joinpath(p))
             return ensure_abspath(p)
         # remote file
-        if remote_parent_path is None or not Path(
-                remote_parent_path).is_absolute():
+        if remote_parent_path is None or not remote_parent_path.is_absolute():
             raise ValueError(
                     'remote path shall be absolute if '
                     'no remote_parent_path is set.')
-        return Path(remote_parent_path).joinpath(p)
+        return remote_parent_path.joinpath(p)
 
     if isinstance(loc, str):
         # https://stackoverflow.com/a/57463161/1824372
-        if loc.startswith('file://'):
-            uri_parsed = urllib.parse.urlparse(loc)
+        if loc.startswith('file:///') and _uri_special_chars.isdisjoint(loc):
+            # local absolute uri that parses to itself
+            uri = loc
+            h = ''
+            p = Path(loc[7:])
+        elif loc.startswith('file://'):
+            uri_parsed = urlsplit(loc)
             uri = loc
             h = uri_parsed.netloc
-            p = urllib.parse.unquote(uri_parsed.path)
+            p = uri_parsed.path
+            if '%' in p:
+                p = unquote(p)
             p = _get_abs_path(h, p)
-        elif re.match(r'^[A-Z]:\\\w', loc):
+        elif loc[1:2] == ':' and _re_windows_path.match(loc):
             # local window path
             h = None
             p = _get_abs_path(h, loc)
@@ -454,8 +635,8 @@ def fileloc(loc, local_parent_path=None, remote_parent_path=None):
         elif ':' in loc:
             h, p = loc.split(':', 1)
             p = _get_abs_path(h, p)
-            uri = urlunsplit(
-                    urlsplit(p.as_uri())._replace(netloc=h))
+            # swap in the host after the "file://" prefix
+            uri = f"file://{h}{p.as_uri()[7:]}"
         else:
             # local file
             h = None
@@ -469,8 +650,7 @@ def fileloc(loc, local_parent_path=None, remote_parent_path=None):
     elif isinstance(loc, tuple):
         h, p = loc
         p = _get_abs_path(h, p)
-        uri = urlunsplit(
-                urlsplit(p.as_uri())._replace(netloc=h))
+        uri = f"file://{h or ''}{p.as_uri()[7:]}"
     else:
         raise ValueError(f'invalid file location {loc}.')
     if h is None or h == 'localhost' or h == '':
@@ -478,6 +658,14 @@ def fileloc(loc, local_parent_path=None, remote_parent_path=None):
     return FileLoc(uri=uri, netloc=h, path=p)
 
 
+@functools.lru_cache(maxsize=4096)
+def _fileloc_cached(loc, local_parent_path, remote_parent_path):
+    return _fileloc(loc, local_parent_path, remote_parent_path)
+
+
+fileloc.cache_clear = _fileloc_cached.cache_clear
+
+
 def make_subprocess_env():
     # on mac os the dyld path may not get propagated
     env = {
@@ -570,4 +758,6 @@ def getname(obj):
     raise NotImplementedError(f"cannot get name for obj {obj}")
 
 
-__all__ = list(set(globals().keys()).difference(_excluded_from_all))
+__all__ = [
+    k for k in set(globals().keys()).difference(_excluded_from_all)
+    if not k.startswith('_')]
@@ -25,13 +25,14 @@ class RegistryMixin(object):
 def register_to(registry, key):
     """Register the decorated item with key."""
 
-    def decorator(cls):
-        if callable(key):
-            _key = key(cls)
-        else:
-            _key = key
-        registry.register(_key, cls)
-        return cls
+    if callable(key):
+        def decorator(cls):
+            registry.register(key(cls), cls)
+            return cls
+    else:
+        def decorator(cls):
+            registry.register(key, cls)
+            return cls
 
     return decorator
 
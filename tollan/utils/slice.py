@@ -160,14 +160,16 @@ class XLoc(object):
         return self
 
 
+_re_slice = re.compile(
+    r'^(?P<start>[+-]?\d+)?(?P<is_slice>:)?'
+    r'(?P<stop>[+-]?\d+)?:?(?P<step>[+-]?\d+)?$'
+    )
+
+
 def parse_slice(slice_str):
     """Return a slice object from string."""
 
-    re_slice = re.compile(
-        r'^(?P<start>[+-]?\d+)?(?P<is_slice>:)?'
-        r'(?P<stop>[+-]?\d+)?:?(?P<step>[+-]?\d+)?$'
-        )
-    m = re.match(re_slice, slice_str)
+    m = _re_slice.match(slice_str)
     if not m:
         return slice(None)
     g = m.groupdict()
@@ -4,7 +4,7 @@ import socket
 import os
 import sys
 import pwd
-import appdirs
+import re
 from pathlib import Path
 
 
@@ -56,22 +56,21 @@ def get_or_create_dir(dirpath, on_exist=None, on_create=None):
 
 def get_user_data_dir():
     """Return the directory for saving user data."""
+    import appdirs
     return Path(appdirs.user_data_dir('tollan', 'toltec'))
 
 
+_re_envfile_entry = re.compile(
+    r'^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$',
+    re.MULTILINE)
+
+
 def parse_systemd_envfile(filepath):
     """Parse systemd environment file into a dict.
 
+    Blank lines, comment lines and lines without ``=`` are skipped.
     """
-    result = dict()
-    with open(filepath, 'r') as fo:
-        for ln in fo.readlines():
-            ln = ln.strip()
-            if ln == '' or ln.strip().startswith("#"):
-                continue
-            k, v = map(str.strip, ln.split('=', 1))
-            result[k] = v
-    return result
+    return dict(_re_envfile_entry.findall(Path(filepath).read_text()))
 
 
 def find_parent_package_path(filepath, package_name, add_to_sys_path=False):
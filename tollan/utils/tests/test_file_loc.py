@@ -1,7 +1,9 @@
 #! /usr/bin/env python
 
-from ..misc import FileLoc, fileloc
+from ..misc import FileLoc, fileloc, filelocs
+import os
 import pytest
+from pathlib import Path
 import re
 
 
@@ -67,3 +69,116 @@ def test_file_loc():
 
     with pytest.raises(ValueError, match='remote path shall be absolute'):
         fl = fileloc('file://a.c')
+
+
+def test_file_loc_cached(tmp_path, monkeypatch):
+
+    fileloc.cache_clear()
+    monkeypatch.chdir(tmp_path)
+    fl = fileloc('/abs/a.b')
+    assert fileloc('/abs/a.b') is fl
+    fl = fileloc('a.b')
+    assert fl.path == tmp_path.resolve().joinpath('a.b')
+
+    # relative paths follow the cwd
+    (tmp_path / 'c').mkdir()
+    monkeypatch.chdir(tmp_path / 'c')
+    assert fileloc('a.b').path == tmp_path.resolve().joinpath('c', 'a.b')
+
+    # paths in the user home follow HOME
+    monkeypatch.setenv('HOME', tmp_path.as_posix())
+    assert fileloc('~/d').path == tmp_path.resolve().joinpath('d')
+    monkeypatch.setenv('HOME', (tmp_path / 'c').as_posix())
+    assert fileloc('~/d').path == tmp_path.resolve().joinpath('c', 'd')
+
+
+def test_file_loc_symlink_cwd(tmp_path, monkeypatch):
+
+    fileloc.cache_clear()
+    (tmp_path / 's1').mkdir()
+    (tmp_path / 's2').mkdir()
+    link = tmp_path / 'cur'
+    link.symlink_to('s1')
+    monkeypatch.chdir(tmp_path)
+    assert fileloc('cur/f').path == tmp_path.resolve().joinpath('s1', 'f')
+    # relative paths follow the retargeted link
+    link.unlink()
+    link.symlink_to('s2')
+    assert fileloc('cur/f').path == tmp_path.resolve().joinpath('s2', 'f')
+    assert fileloc('cur/f', local_parent_path=tmp_path).path == \
+        tmp_path.resolve().joinpath('s2', 'f')
+
+
+def test_file_loc_deleted_cwd(tmp_path, monkeypatch):
+
+    fileloc.cache_clear()
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+    cwd.rmdir()
+    # locations that do not depend on the cwd still work
+    fl = fileloc('/abs/x')
+    assert fl.path == Path('/abs/x')
+    assert fl.is_local
+    fl = fileloc('host:/abs/x')
+    assert fl.uri == 'file://host/abs/x'
+    fl = fileloc(('host', '/abs/y'))
+    assert fl.uri == 'file://host/abs/y'
+    assert filelocs(['/abs/x', 'host:/abs/x']) == [
+        fileloc('/abs/x'), fileloc('host:/abs/x')]
+
+
+def test_file_loc_exists_many(tmp_path):
+
+    (tmp_path / 'a').touch()
+    (tmp_path / 'd').mkdir()
+    (tmp_path / 'd' / 'b').touch()
+    (tmp_path / 'l').symlink_to(tmp_path / 'missing')
+    locs = [
+        fileloc(tmp_path / 'a'),
+        fileloc(tmp_path / 'c'),
+        fileloc(tmp_path / 'd' / 'b'),
+        fileloc(tmp_path / 'e' / 'b'),
+        fileloc(tmp_path / 'l'),
+        fileloc('a:/b.c'),
+        ]
+    assert FileLoc.exists_many(locs) == [fl.exists() for fl in locs]
+    assert FileLoc.exists_many(locs) == [
+            True, False, True, False, False, False]
+
+    # names that are not in directory listings
+    locs = [
+        fileloc((tmp_path / 'd').as_posix() + '/..'),
+        fileloc((tmp_path / 'e').as_posix() + '/..'),
+        fileloc('/'),
+        ]
+    assert FileLoc.exists_many(locs) == [fl.exists() for fl in locs]
+    assert FileLoc.exists_many(locs) == [True, False, True]
+
+
+def test_file_loc_exists_many_unlisted_parent(tmp_path, monkeypatch):
+
+    (tmp_path / 'd').mkdir()
+    (tmp_path / 'd' / 'b').touch()
+    scandir = os.scandir
+
+    def scandir_no_read(path):
+        # mimic a parent directory that is searchable but not readable
+        if os.fspath(path) == (tmp_path / 'd').as_posix():
+            raise PermissionError(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, 'scandir', scandir_no_read)
+    locs = [
+        fileloc(tmp_path / 'd' / 'b'),
+        fileloc(tmp_path / 'd' / 'c'),
+        fileloc(tmp_path / 'd'),
+        ]
+    assert FileLoc.exists_many(locs) == [True, False, True]
+
+
+def test_file_locs():
+
+    locs = ['a:b.c', ('d', 'e.f'), FileLoc(uri='a', netloc='b', path='c')]
+    assert filelocs(locs, remote_parent_path='/') == [
+        fileloc(loc, remote_parent_path='/') for loc in locs]
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+
+from ..fmt import pformat_yaml
+import yaml
+
+
+def test_pformat_yaml():
+
+    shared = {'a': 1}
+    s = pformat_yaml({'x': shared, 'y': shared})
+    assert '&id' not in s
+    assert '*id' not in s
+    assert yaml.safe_load(s) == {'x': {'a': 1}, 'y': {'a': 1}}
+
+    s = pformat_yaml({'text': 'line1\nline2\n'})
+    assert s == '\ntext: |\n  line1\n  line2\n'
+
+    s = pformat_yaml({'s': {1}})
+    assert '!!set' not in s
+    assert yaml.safe_load(s) == {'s': [1]}
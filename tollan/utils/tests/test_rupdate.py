@@ -49,6 +49,8 @@ def test_rupdate_list():
     rupdate(d, {0: {'b': 2}})
     assert (d == [{'a': 1, 'b': 2}, 3])
     assert (u0 == {0: {'a': 1, 'b': 2}})
+    rupdate(d, {'1': {'c': 3}})
+    assert (d == [{'a': 1, 'b': 2}, {'c': 3}])
 
 
 def test_rupdate_append_list():
@@ -0,0 +1,24 @@
+#! /usr/bin/env python
+
+from ..sys import parse_systemd_envfile
+
+
+def test_parse_systemd_envfile(tmp_path):
+
+    envfile = tmp_path / 'test.env'
+    envfile.write_text(
+        '# comment\n'
+        '  A = 1 \n'
+        '\n'
+        'B=x=y\r\n'
+        '   # indented comment\n'
+        'C=\n'
+        'D E = a b\n'
+        'invalid\n'
+        )
+    assert parse_systemd_envfile(envfile) == {
+        'A': '1',
+        'B': 'x=y',
+        'C': '',
+        'D E': 'a b',
+        }